@@ -372,30 +372,20 @@ from functools import partial
 
 import click
 import requests
-from tqdm import tqdm
-
-from renku.core.commands.dataset import (
-    add_file,
-    create_dataset,
-    dataset_remove,
-    edit_dataset,
-    export_dataset,
-    file_unlink,
-    import_dataset,
-    list_datasets,
-    list_files,
-    list_tags,
-    remove_dataset_tags,
-    tag_dataset_with_client,
-    update_datasets,
-)
-from renku.core.commands.echo import WARNING, progressbar
+
+from renku.core.commands.echo import DISABLE_PROGRESS, WARNING, progressbar
 from renku.core.commands.format.dataset_files import DATASET_FILES_COLUMNS, DATASET_FILES_FORMATS
 from renku.core.commands.format.dataset_tags import DATASET_TAGS_FORMATS
 from renku.core.commands.format.datasets import DATASETS_COLUMNS, DATASETS_FORMATS
 from renku.core.errors import DatasetNotFound, InvalidAccessToken
 from renku.core.management.datasets import DownloadProgressCallback
 
+_DATASETS_COLUMNS_HELP = "Comma-separated list of column to display: {}.".format(", ".join(DATASETS_COLUMNS))
+_DATASET_FILES_COLUMNS_HELP = "Comma-separated list of column to display: {}.".format(", ".join(DATASET_FILES_COLUMNS))
+
+_ADD_PROGRESS = partial(progressbar, label="Adding data to dataset")
+_UPDATE_PROGRESS = partial(progressbar, label="Checking files for updates")
+
 
 def prompt_access_token(exporter):
     """Prompt user for an access token for a provider.
@@ -416,7 +406,7 @@ def prompt_tag_selection(tags):
 
     text_prompt = "Tag to export: \n\n<HEAD>\t[1]\n"
 
-    text_prompt += "\n".join("{}\t[{}]".format(t.name, i) for i, t in enumerate(tags, start=2))
+    text_prompt += "\n".join([f"{t.name}\t[{i}]" for i, t in enumerate(tags, start=2)])
 
     text_prompt += "\n\nTag"
     selection = click.prompt(text_prompt, type=click.IntRange(1, len(tags) + 1), default=1)
@@ -441,12 +431,14 @@ def dataset():
     type=click.STRING,
     default="id,name,title,version",
     metavar="<columns>",
-    help="Comma-separated list of column to display: {}.".format(", ".join(DATASETS_COLUMNS.keys())),
+    help=_DATASETS_COLUMNS_HELP,
     show_default=True,
 )
 @click.pass_context
 def list_dataset(ctx, revision, format, columns):
     """Handle datasets."""
+    from renku.core.commands.dataset import list_datasets
+
     click.echo(list_datasets(revision=revision, format=format, columns=columns))
 
 
@@ -465,6 +457,8 @@ def list_dataset(ctx, revision, format, columns):
 @click.option("-k", "--keyword", default=None, multiple=True, type=click.STRING, help="List of keywords or tags.")
 def create(name, title, description, creators, keyword):
     """Create an empty dataset in the current repo."""
+    from renku.core.commands.dataset import create_dataset
+
     creators = creators or ()
 
     new_dataset = create_dataset(name=name, title=title, description=description, creators=creators, keywords=keyword,)
@@ -488,6 +482,8 @@ def create(name, title, description, creators, keyword):
 @click.option("-k", "--keyword", default=None, multiple=True, type=click.STRING, help="List of keywords or tags.")
 def edit(name, title, description, creators, keyword):
     """Edit dataset metadata."""
+    from renku.core.commands.dataset import edit_dataset
+
     creators = creators or ()
     keywords = keyword or ()
 
@@ -530,7 +526,8 @@ def edit(name, title, description, creators, keyword):
 @click.option("--ref", default=None, help="Add files from a specific commit/tag/branch.")
 def add(name, urls, external, force, overwrite, create, sources, destination, ref):
     """Add data to a dataset."""
-    progress = partial(progressbar, label="Adding data to dataset")
+    from renku.core.commands.dataset import add_file
+
     add_file(
         urls=urls,
         name=name,
@@ -541,7 +538,7 @@ def add(name, urls, external, force, overwrite, create, sources, destination, re
         sources=sources,
         destination=destination,
         ref=ref,
-        urlscontext=progress,
+        urlscontext=_ADD_PROGRESS,
         progress=_DownloadProgressbar,
         interactive=True,
     )
@@ -563,11 +560,13 @@ def add(name, urls, external, force, overwrite, create, sources, destination, re
     type=click.STRING,
     default="dataset_name,added,size,path,lfs",
     metavar="<columns>",
-    help="Comma-separated list of column to display: {}.".format(", ".join(DATASET_FILES_COLUMNS.keys())),
+    help=_DATASET_FILES_COLUMNS_HELP,
     show_default=True,
 )
 def ls_files(names, creators, include, exclude, format, columns):
     """List files in dataset."""
+    from renku.core.commands.dataset import list_files
+
     click.echo(list_files(names, creators, include, exclude, format, columns))
 
 
@@ -578,6 +577,8 @@ def ls_files(names, creators, include, exclude, format, columns):
 @click.option("-y", "--yes", is_flag=True, help="Confirm unlinking of all files.")
 def unlink(name, include, exclude, yes):
     """Remove matching files from a dataset."""
+    from renku.core.commands.dataset import file_unlink
+
     file_unlink(name=name, include=include, exclude=exclude, yes=yes, interactive=True)
 
     click.secho("OK", fg="green")
@@ -587,6 +588,8 @@ def unlink(name, include, exclude, yes):
 @click.argument("name")
 def remove(name):
     """Delete a dataset."""
+    from renku.core.commands.dataset import dataset_remove
+
     dataset_remove(name)
     click.secho("OK", fg="green")
 
@@ -598,6 +601,8 @@ def remove(name):
 @click.option("--force", is_flag=True, help="Allow overwriting existing tags.")
 def tag(name, tag, description, force):
     """Create a tag for a dataset."""
+    from renku.core.commands.dataset import tag_dataset_with_client
+
     tag_dataset_with_client(name, tag, description, force)
     click.secho("OK", fg="green")
 
@@ -607,6 +612,8 @@ def tag(name, tag, description, force):
 @click.argument("tags", nargs=-1)
 def remove_tags(name, tags):
     """Remove tags from a dataset."""
+    from renku.core.commands.dataset import remove_dataset_tags
+
     remove_dataset_tags(name, tags)
     click.secho("OK", fg="green")
 
@@ -616,6 +623,8 @@ def remove_tags(name, tags):
 @click.option("--format", type=click.Choice(DATASET_TAGS_FORMATS), default="tabular", help="Choose an output format.")
 def ls_tags(name, format):
     """List all tags of a dataset."""
+    from renku.core.commands.dataset import list_tags
+
     tags_output = list_tags(name, format)
     click.echo(tags_output)
 
@@ -629,6 +638,8 @@ def ls_tags(name, format):
 @click.option("--dataverse-name", default=None, help="Dataverse name to export to.")
 def export_(name, provider, publish, tag, dataverse_server, dataverse_name):
     """Export data to 3rd party provider."""
+    from renku.core.commands.dataset import export_dataset
+
     try:
         output = export_dataset(
             name=name,
@@ -657,6 +668,8 @@ def import_(uri, name, extract, yes):
 
     Supported providers: [Dataverse, Renku, Zenodo]
     """
+    from renku.core.commands.dataset import import_dataset
+
     import_dataset(uri=uri, name=name, extract=extract, with_prompt=True, yes=yes, progress=_DownloadProgressbar)
     click.secho(" " * 79 + "\r", nl=False)
     click.secho("OK", fg="green")
@@ -665,6 +678,8 @@ def import_(uri, name, extract, yes):
 class _DownloadProgressbar(DownloadProgressCallback):
     def __init__(self, description, total_size):
         """Default initializer."""
+        from tqdm import tqdm
+
         self._progressbar = tqdm(
             total=total_size,
             unit="iB",
@@ -672,6 +687,9 @@ class _DownloadProgressbar(DownloadProgressCallback):
             desc=description,
             leave=False,
             bar_format="{desc:.32}: {percentage:3.0f}%|{bar}{r_bar}",
+            miniters=max(1, total_size // 200),
+            mininterval=0.25,
+            disable=DISABLE_PROGRESS,
         )
 
     def update(self, size):
@@ -698,15 +716,16 @@ class _DownloadProgressbar(DownloadProgressCallback):
 @click.option("-e", "--external", is_flag=True, help="Update external data.")
 def update(names, creators, include, exclude, ref, delete, external):
     """Updates files in dataset from a remote Git repo."""
-    progress_context = partial(progressbar, label="Checking files for updates")
+    from renku.core.commands.dataset import update_datasets
+
     update_datasets(
-        names=list(names),
+        names=names,
         creators=creators,
         include=include,
         exclude=exclude,
         ref=ref,
         delete=delete,
         external=external,
-        progress_context=progress_context,
+        progress_context=_UPDATE_PROGRESS,
     )
     click.secho("OK", fg="green")
@@ -16,6 +16,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Repository datasets management."""
+import fnmatch
 import re
 import shutil
 import urllib
@@ -49,18 +50,21 @@ from .format.datasets import DATASETS_FORMATS
 @pass_local_client(clean=False, commit=False)
 def list_datasets(client, revision=None, format=None, columns=None):
     """Handle datasets sub commands."""
+    # NOTE: The tabular output shows only dataset-level metadata.
+    skip_files = format == "tabular"
     if revision is None:
-        datasets = client.datasets.values()
+        datasets = client.get_datasets(skip_files=skip_files).values()
     else:
-        datasets = client.datasets_from_commit(client.repo.commit(revision))
+        datasets = client.datasets_from_commit(client.repo.commit(revision), skip_files=skip_files)
 
     if format is None:
         return list(datasets)
 
-    if format not in DATASETS_FORMATS:
+    formatter = DATASETS_FORMATS.get(format)
+    if formatter is None:
         raise UsageError("format not supported")
 
-    return DATASETS_FORMATS[format](client, datasets, columns=columns)
+    return formatter(client, datasets, columns=columns)
 
 
 @pass_local_client(clean=False, requires_migration=True, commit=True, commit_only=DATASET_METADATA_PATHS)
@@ -267,19 +271,29 @@ def _add_to_dataset(
 def list_files(client, datasets=None, creators=None, include=None, exclude=None, format=None, columns=None):
     """List files in dataset."""
     records = _filter(client, names=datasets, creators=creators, include=include, exclude=exclude)
+
+    # NOTE: Compute dataset-level values once per dataset instead of once per file.
+    dataset_values = {}
     for record in records:
-        record.title = record.dataset.title
-        record.dataset_name = record.dataset.name
-        record.creators_csv = record.dataset.creators_csv
-        record.creators_full_csv = record.dataset.creators_full_csv
+        dataset = record.dataset
+        values = dataset_values.get(dataset.name)
+        if values is None:
+            values = dataset_values[dataset.name] = (
+                dataset.title,
+                dataset.name,
+                dataset.creators_csv,
+                dataset.creators_full_csv,
+            )
+        record.title, record.dataset_name, record.creators_csv, record.creators_full_csv = values
 
     if format is None:
         return records
 
-    if format not in DATASETS_FORMATS:
+    formatter = DATASET_FILES_FORMATS.get(format)
+    if formatter is None:
         raise UsageError("format not supported")
 
-    return DATASET_FILES_FORMATS[format](client, records, columns=columns)
+    return formatter(client, records, columns=columns)
 
 
 @pass_local_client(
@@ -336,6 +350,7 @@ def dataset_remove(client, name, commit_message=None):
 
     metadata_path = client.path / dataset.path
     shutil.rmtree(metadata_path, ignore_errors=True)
+    client.clear_datasets_metadata_files_cache()
 
     references = list(LinkReference.iter_items(client, common_path="datasets"))
     for ref in references:
@@ -613,6 +628,8 @@ def update_datasets(
 ):
     """Update files from a remote Git repo."""
     ignored_datasets = []
+    # NOTE: Names of updated imported datasets are removed from this working copy.
+    names = set(names or ())
 
     if (include or exclude) and names and any(d.same_as for d in client.datasets.values() if d.name in names):
         raise errors.UsageError(
@@ -707,24 +724,49 @@ def update_datasets(
     click.echo("Updated {} files".format(len(updated_files)))
 
 
+def _compile_patterns(patterns):
+    """Compile ``Path.match`` patterns once so that they can be matched against many paths.
+
+    :param patterns: Tuple containing file patterns.
+    """
+    compiled = []
+    for pattern in patterns or ():
+        pattern = Path(pattern)
+        if not pattern.parts:
+            raise ValueError("empty pattern")
+        # NOTE: Like ``Path.match``, each part matches a single path component starting from the right.
+        matchers = tuple(re.compile(fnmatch.translate(part)).match for part in reversed(pattern.parts))
+        compiled.append((bool(pattern.anchor), matchers))
+
+    return compiled
+
+
+def _match_any(parts, patterns):
+    """Check if reversed path components match one of compiled patterns."""
+    for anchored, matchers in patterns:
+        if len(matchers) > len(parts) or (anchored and len(matchers) != len(parts)):
+            continue
+        if all(match(part) for match, part in zip(matchers, parts)):
+            return True
+
+    return False
+
+
 def _include_exclude(file_path, include=None, exclude=None):
     """Check if file matches one of include filters and not in exclude filter.
 
     :param file_path: Path to the file.
-    :param include: Tuple containing patterns to which include from result.
-    :param exclude: Tuple containing patterns to which exclude from result.
+    :param include: Compiled patterns to which include from result.
+    :param exclude: Compiled patterns to which exclude from result.
     """
-    if exclude is not None and exclude:
-        for pattern in exclude:
-            if file_path.match(pattern):
-                return False
-
-    if include is not None and include:
-        for pattern in include:
-            if file_path.match(pattern):
-                return True
+    parts = file_path.parts[::-1]
+
+    if exclude and _match_any(parts, exclude):
         return False
 
+    if include:
+        return _match_any(parts, include)
+
     return True
 
 
@@ -743,23 +785,27 @@ def _filter(client, names=None, creators=None, include=None, exclude=None, ignor
     if isinstance(creators, list) or isinstance(creators, tuple):
         creators = set(creators)
 
+    names = frozenset(names or ())
+    ignore = frozenset(ignore or ())
+    include = _compile_patterns(include)
+    exclude = _compile_patterns(exclude)
+
     records = []
     unused_names = set(names)
     for dataset in client.datasets.values():
-        if (not names or dataset.name in names) and (not ignore or dataset.name not in ignore):
+        if (not names or dataset.name in names) and dataset.name not in ignore:
             if unused_names:
                 unused_names.remove(dataset.name)
+
+            if creators and not creators.issubset({c.name for c in dataset.creators}):
+                continue
+
             for file_ in dataset.files:
                 file_.dataset = dataset
                 file_.client = client
                 path = Path(file_.path)
-                match = _include_exclude(path, include, exclude)
-
-                if creators:
-                    dataset_creators = {c.name for c in dataset.creators}
-                    match = match and creators.issubset(dataset_creators)
 
-                if match:
+                if _include_exclude(path, include, exclude):
                     records.append(file_)
 
     if unused_names:
@@ -17,6 +17,7 @@
 # limitations under the License.
 """Custom console echo."""
 
+import contextlib
 import functools
 import os
 
@@ -27,6 +28,9 @@ INFO = click.style("Info: ", bold=True, fg="blue")
 WARNING = click.style("Warning: ", bold=True, fg="yellow")
 ERROR = click.style("Error: ", bold=True, fg="red")
 
+DISABLE_PROGRESS = os.environ.get("RENKU_DISABLE_PROGRESS", "").lower() in ("1", "true", "yes")
+"""Hide progress bars when ``RENKU_DISABLE_PROGRESS`` is set."""
+
 
 def echo_via_pager(*args, **kwargs):
     """Display pager only if it does not fit in one terminal screen.
@@ -42,9 +46,18 @@ def echo_via_pager(*args, **kwargs):
             os.environ.pop("LESS", None)
 
 
-progressbar = functools.partial(
-    click.progressbar, fill_char=click.style(" ", bg="green"), show_pos=True, item_show_func=lambda x: x,
-)
+@contextlib.contextmanager
+def _no_progressbar(iterable=None, **kwargs):
+    """Iterate over a collection without displaying progress."""
+    yield iterable
+
+
+if DISABLE_PROGRESS:
+    progressbar = _no_progressbar
+else:
+    progressbar = functools.partial(
+        click.progressbar, fill_char=click.style(" ", bg="green"), show_pos=True, item_show_func=lambda x: x,
+    )
 
 
 class GitProgress(RemoteProgress):
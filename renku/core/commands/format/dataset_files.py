@@ -17,7 +17,7 @@
 # limitations under the License.
 """Serializers for dataset list files."""
 import re
-from subprocess import PIPE, SubprocessError, run
+from subprocess import PIPE, Popen, SubprocessError
 
 from humanize import naturalsize
 
@@ -67,26 +67,25 @@ def _get_lfs_file_sizes(client, records):
     """Try to get file size from Git LFS."""
     lfs_files_sizes = {}
 
+    # Example line format: relative/path/to/file (7.9 MB)
+    pattern = re.compile(r"^(.*?)\s*\((.*)\)")
+
     try:
-        lfs_run = run(
+        with Popen(
             ("git", "lfs", "ls-files", "--name-only", "--size"), stdout=PIPE, cwd=client.path, universal_newlines=True
-        )
+        ) as lfs_process:
+            # NOTE: Parse lines as git writes them instead of buffering the whole output.
+            for line in lfs_process.stdout:
+                match = pattern.search(line)
+                if not match:
+                    continue
+                path, size = match.groups()
+                # Fix alignment for bytes
+                if size.endswith(" B"):
+                    size = size.replace(" B", "  B")
+                lfs_files_sizes[path] = size
     except SubprocessError:
         pass
-    else:
-        lfs_output = lfs_run.stdout.split("\n")
-        # Example line format: relative/path/to/file (7.9 MB)
-        pattern = re.compile(r"^(.*?)\s*\((.*)\)")
-
-        for line in lfs_output:
-            match = pattern.search(line)
-            if not match:
-                continue
-            path, size = match.groups()
-            # Fix alignment for bytes
-            if size.endswith(" B"):
-                size = size.replace(" B", "  B")
-            lfs_files_sizes[path] = size
 
     non_lfs_files_sizes = {o.path: o.size for o in client.repo.tree().traverse() if o.path not in lfs_files_sizes}
     non_lfs_files_sizes = {k: naturalsize(v).upper().replace("BYTES", " B") for k, v in non_lfs_files_sizes.items()}
@@ -18,8 +18,6 @@
 """Serializers for datasets."""
 import textwrap
 
-from renku.core.models.json import dumps
-
 from .tabulate import tabulate
 
 
@@ -41,6 +39,8 @@ def _create_dataset_short_description(datasets):
 
 def jsonld(client, datasets, **kwargs):
     """Format datasets as JSON-LD."""
+    from renku.core.models.json import dumps
+
     data = [dataset.as_jsonld() for dataset in datasets]
     return dumps(data, indent=2)
 
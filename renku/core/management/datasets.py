@@ -68,6 +68,11 @@ class DatasetsApiMixin(object):
     CACHE = "cache"
     """Directory to cache transient data."""
 
+    CONCURRENT_READS_THRESHOLD = 16
+    """Number of dataset metadata files from which reading them concurrently pays off starting a thread pool."""
+
+    _datasets_metadata_files_cache = attr.ib(default=None, init=False, repr=False)
+
     @property
     def renku_datasets_path(self):
         """Return a ``Path`` instance of Renku dataset metadata folder."""
@@ -80,7 +85,7 @@ class DatasetsApiMixin(object):
         path.mkdir(exist_ok=True)
         return path
 
-    def datasets_from_commit(self, commit=None):
+    def datasets_from_commit(self, commit=None, skip_files=False):
         """Return datasets defined in a commit."""
         commit = commit or self.repo.head.commit
 
@@ -94,25 +99,80 @@ class DatasetsApiMixin(object):
                 blob = tree / self.METADATA
             except KeyError:
                 continue
-            dataset = Dataset.from_yaml(self.path / Path(blob.path), client=self)
+            dataset = Dataset.from_yaml(self.path / Path(blob.path), client=self, skip_files=skip_files)
             dataset.commit = commit
             yield dataset
 
     @property
     def datasets(self):
         """Return mapping from path to dataset."""
-        result = {}
-        paths = self.renku_datasets_path.rglob(self.METADATA)
-        for path in paths:
-            result[path] = self.load_dataset_from_path(path)
-        return result
+        return self.get_datasets()
+
+    def get_datasets(self, skip_files=False):
+        """Return mapping from path to dataset.
+
+        :param skip_files: Do not load dataset files.
+        """
+        paths = self.get_datasets_metadata_files()
+        if not paths:
+            return {}
+
+        if len(paths) < self.CONCURRENT_READS_THRESHOLD:
+            contents = [path.read_bytes() for path in paths]
+        else:
+            max_workers = min(32, len(paths))
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+                # NOTE: Issue all reads in one burst before parsing from memory.
+                contents = list(executor.map(Path.read_bytes, paths))
+
+        load_dataset = self.load_dataset_from_path
+        # NOTE: Datasets are parsed on the calling thread since deserialization queries the repository through
+        # GitPython's shared ``cat-file`` process, which is not thread-safe.
+        return {
+            path: load_dataset(path, content=content, skip_files=skip_files) for path, content in zip(paths, contents)
+        }
+
+    def get_datasets_metadata_files(self):
+        """Return paths of all dataset metadata files in the working tree.
+
+        Results are reused until the modification time of the datasets folder changes or the cache is cleared.
+        """
+        try:
+            key = self.renku_datasets_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        if self._datasets_metadata_files_cache and self._datasets_metadata_files_cache[0] == key:
+            return list(self._datasets_metadata_files_cache[1])
+
+        paths = []
+        directories = [str(self.renku_datasets_path)]
+        # NOTE: ``scandir`` reports entry types without an extra ``stat`` call per entry.
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.name == self.METADATA and entry.is_file():
+                        paths.append(Path(entry.path))
+
+        self._datasets_metadata_files_cache = (key, tuple(paths))
+        return paths
+
+    def clear_datasets_metadata_files_cache(self):
+        """Forget cached paths of dataset metadata files.
+
+        Must be called whenever dataset metadata files are added or removed since the modification time of the
+        datasets folder does not change when its subfolders do and may not change within the same clock tick.
+        """
+        self._datasets_metadata_files_cache = None
 
-    def load_dataset_from_path(self, path, commit=None):
+    def load_dataset_from_path(self, path, commit=None, content=None, skip_files=False):
         """Return a dataset from a given path."""
         path = Path(path)
         if not path.is_absolute():
             path = self.path / path
-        return Dataset.from_yaml(path, client=self, commit=commit)
+        return Dataset.from_yaml(path, client=self, commit=commit, content=content, skip_files=skip_files)
 
     def get_dataset_path(self, name):
         """Get dataset path from name."""
@@ -163,6 +223,7 @@ class DatasetsApiMixin(object):
             if clean_up_required:
                 dataset_ref.delete()
                 shutil.rmtree(path.parent, ignore_errors=True)
+                self.clear_datasets_metadata_files_cache()
             raise
 
         dataset.to_yaml()
@@ -213,6 +274,7 @@ class DatasetsApiMixin(object):
         dataset_ref.set_reference(metadata_path)
 
         dataset.to_yaml(path=metadata_path)
+        self.clear_datasets_metadata_files_cache()
 
         return dataset, metadata_path, dataset_ref
 
@@ -286,7 +348,8 @@ class DatasetsApiMixin(object):
         # Remove all files that are under a .git directory
         paths_to_avoid = [f["path"] for f in files if ".git" in str(f["path"]).split(os.path.sep)]
         if paths_to_avoid:
-            files = [f for f in files if f["path"] not in paths_to_avoid]
+            paths_to_avoid_set = set(paths_to_avoid)
+            files = [f for f in files if f["path"] not in paths_to_avoid_set]
             warning_messages.append(
                 "Ignored adding paths under a .git directory:\n  " + "\n  ".join(str(p) for p in paths_to_avoid)
             )
@@ -128,6 +128,8 @@ def migrate(
                 module.migrate(client)
             except (Exception, BaseException) as e:
                 raise MigrationError("Couldn't execute migration") from e
+            # NOTE: Migrations may move dataset metadata files which later migrations list again.
+            client.clear_datasets_metadata_files_cache()
             n_migrations_executed += 1
     if n_migrations_executed > 0:
         client._project = None  # NOTE: force reloading of project metadata
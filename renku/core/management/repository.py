@@ -387,6 +387,7 @@ class RepositoryApiMixin(GitCore):
                 raise ValueError("Couldn't get active branch or commit", e)
 
         self.repo.git.checkout(commit)
+        self.clear_datasets_metadata_files_cache()
 
         try:
             yield
@@ -395,6 +396,7 @@ class RepositoryApiMixin(GitCore):
                 self.repo.git.checkout(current_branch)
             elif current_commit:
                 self.repo.git.checkout(current_commit)
+            self.clear_datasets_metadata_files_cache()
 
     @contextmanager
     def with_metadata(self, read_only=False, name=None):
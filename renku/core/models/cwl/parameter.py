@@ -25,21 +25,22 @@ def convert_default(value):
     return value
 
 
-@attr.s
-class _IdMixin(object):
-    """Define id field."""
-
-    id = attr.ib(default=None)
-
-
-@attr.s
+@attr.s(slots=True)
 class Parameter(object):
     """Define an input or output parameter to a process."""
 
     streamable = attr.ib(default=None, converter=bool)
 
 
-@attr.s
+@attr.s(slots=True)
+class _IdMixin(Parameter):
+    """Define id field."""
+
+    # NOTE: Extends Parameter because two slotted bases cannot be combined.
+    id = attr.ib(default=None)
+
+
+@attr.s(slots=True)
 class InputParameter(_IdMixin, Parameter):
     """An input parameter."""
 
@@ -49,7 +50,7 @@ class InputParameter(_IdMixin, Parameter):
     inputBinding = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class CommandLineBinding(object):
     """Define the binding behavior when building the command line."""
 
@@ -95,7 +96,7 @@ class CommandLineBinding(object):
         return _convert(value)
 
 
-@attr.s
+@attr.s(slots=True)
 class CommandInputParameter(InputParameter):
     """An input parameter for a CommandLineTool."""
 
@@ -118,7 +119,7 @@ class CommandInputParameter(InputParameter):
         return self.inputBinding.to_argv(default=self.default, **kwargs) if self.inputBinding else []
 
 
-@attr.s
+@attr.s(slots=True)
 class OutputParameter(_IdMixin, Parameter):
     """An output parameter."""
 
@@ -128,7 +129,7 @@ class OutputParameter(_IdMixin, Parameter):
     outputBinding = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class CommandOutputBinding(object):
     """Define the binding behavior for outputs."""
 
@@ -136,7 +137,7 @@ class CommandOutputBinding(object):
     # loadContents, outputEval
 
 
-@attr.s
+@attr.s(slots=True)
 class CommandOutputParameter(OutputParameter):
     """Define an output parameter for a CommandLineTool."""
 
@@ -148,7 +149,7 @@ class CommandOutputParameter(OutputParameter):
     )
 
 
-@attr.s
+@attr.s(slots=True)
 class WorkflowOutputParameter(OutputParameter):
     """Define an output parameter for a Workflow."""
 
@@ -384,7 +384,7 @@ class Dataset(Entity, CreatorMixin):
 
     date_created = attr.ib(converter=parse_date, kw_only=True)
 
-    files = attr.ib(factory=list, converter=_convert_dataset_files, kw_only=True)
+    _files = attr.ib(factory=list, converter=_convert_dataset_files, kw_only=True)
 
     tags = attr.ib(factory=list, converter=_convert_dataset_tags, kw_only=True)
 
@@ -402,6 +402,10 @@ class Dataset(Entity, CreatorMixin):
 
     _metadata_path = attr.ib(default=None, init=False)
 
+    _files_metadata_updated = attr.ib(default=False, init=False, eq=False, repr=False)
+
+    _files_skipped = attr.ib(default=False, init=False, eq=False, repr=False)
+
     @date_created.default
     def _now(self):
         """Define default value for datetime fields."""
@@ -414,6 +418,23 @@ class Dataset(Entity, CreatorMixin):
         if value and not is_dataset_name_valid(value):
             raise errors.ParameterError('Invalid "name": {}'.format(value))
 
+    @property
+    def files(self):
+        """Return dataset files.
+
+        Their metadata is updated from the client's working tree on first access, not when the dataset is loaded.
+        """
+        if not self._files_metadata_updated:
+            self._files_metadata_updated = True
+            self._update_files_metadata()
+        return self._files
+
+    @files.setter
+    def files(self, files):
+        """Set dataset files."""
+        self._files = files
+        self._files_metadata_updated = True
+
     @property
     def short_id(self):
         """Shorter version of identifier."""
@@ -459,13 +480,15 @@ class Dataset(Entity, CreatorMixin):
 
     def find_files(self, paths):
         """Return all paths that are in files container."""
-        files_paths = {str(self.client.path / f.path) for f in self.files}
+        client_path = self.client.path
+        files_paths = {str(client_path / f.path) for f in self.files}
         return {p for p in paths if str(p) in files_paths}
 
     def find_file(self, path, return_index=False):
         """Find a file in files container using its relative path."""
+        path = str(path)
         for index, file_ in enumerate(self.files):
-            if str(file_.path) == str(path):
+            if str(file_.path) == path:
                 if return_index:
                     return index
                 file_.client = self.client
@@ -547,6 +570,8 @@ class Dataset(Entity, CreatorMixin):
         Do not mutate more than once before committing the metadata or otherwise there would be missing links in the
         chain of changes.
         """
+        if self._files_skipped:
+            raise errors.OperationError(f"Cannot mutate a dataset loaded without its files: {self.name}")
         if self.immutable:
             raise errors.OperationError(f"Cannot mutate an immutable dataset: {self.name}")
 
@@ -613,8 +638,6 @@ class Dataset(Entity, CreatorMixin):
             absolute_path = LinkReference(client=self.client, name=f"datasets/{self.name}").reference.parent
             self.path = str(absolute_path.relative_to(self.client.path))
 
-        self._update_files_metadata()
-
         try:
             if self.client:
                 self.commit = self.client.find_previous_commit(self.path, revision=self.commit or "HEAD")
@@ -633,13 +656,14 @@ class Dataset(Entity, CreatorMixin):
         attrs = self.client.find_attr(*paths)
 
         for file_ in self.files:
-            path = Path(file_.path)
+            # NOTE: Files are resolved against the client since the working directory may have changed after loading.
+            path = self.client.path / file_.path
             file_exists = path.exists() or (path.is_symlink() and os.path.lexists(path))
 
             if not file_exists:
                 continue
 
-            if attrs.get(str(path), {}).get("filter") == "lfs":
+            if attrs.get(str(Path(file_.path)), {}).get("filter") == "lfs":
                 file_.is_lfs = True
             else:
                 file_.is_lfs = False
@@ -652,12 +676,19 @@ class Dataset(Entity, CreatorMixin):
                 file_.client = client
 
     @classmethod
-    def from_yaml(cls, path, client=None, commit=None):
-        """Return an instance from a YAML file."""
-        data = jsonld.read_yaml(path)
+    def from_yaml(cls, path, client=None, commit=None, content=None, skip_files=False):
+        """Return an instance from a YAML file.
+
+        :param content: Already read content of the file at ``path``.
+        :param skip_files: Do not load dataset files; use when only dataset-level metadata is needed.
+        """
+        data = jsonld.read_yaml(path) if content is None else jsonld.load_yaml(content)
+        if skip_files:
+            data = _remove_dataset_files(data)
 
         self = cls.from_jsonld(data=data, client=client, commit=commit)
         self._metadata_path = path
+        self._files_skipped = skip_files
 
         return self
 
@@ -674,6 +705,10 @@ class Dataset(Entity, CreatorMixin):
 
     def to_yaml(self, path=None):
         """Write an instance to the referenced YAML file."""
+        # NOTE: Writing would drop the files which were not loaded from the metadata file.
+        if self._files_skipped:
+            raise errors.OperationError(f"Cannot write a dataset loaded without its files: {self.name}")
+
         if self._modified and not self.immutable:
             self.mutate()
 
@@ -823,6 +858,28 @@ class DatasetSchema(EntitySchema, CreatorMixinSchema):
         return obj
 
 
+def _remove_dataset_files(data):
+    """Remove files and their nodes from flattened dataset JSON-LD data."""
+    if not isinstance(data, list):
+        return data
+
+    has_part = str(schema.hasPart)
+    dataset_type = str(schema.Dataset)
+    file_ids = set()
+
+    for node in data:
+        types = node.get("@type") or []
+        if isinstance(types, str):
+            types = [types]
+        if dataset_type in types:
+            parts = node.pop(has_part, None) or []
+            if isinstance(parts, dict):
+                parts = [parts]
+            file_ids.update(part.get("@id") for part in parts)
+
+    return [node for node in data if node.get("@id") not in file_ids]
+
+
 def is_dataset_name_valid(name):
     """A valid name is a valid Git reference name with no /."""
     # TODO make name an RFC 3986 compatible and migrate old projects
@@ -59,8 +59,14 @@ NoDatesSafeLoader.remove_implicit_resolver("tag:yaml.org,2002:timestamp")
 
 def read_yaml(path):
     """Load YAML file and return its content as a dict."""
-    with Path(path).open(mode="r") as fp:
-        return yaml.load(fp, Loader=NoDatesSafeLoader) or {}
+    # NOTE: Pass raw bytes so that libyaml decodes the stream itself.
+    with Path(path).open(mode="rb") as fp:
+        return load_yaml(fp)
+
+
+def load_yaml(content):
+    """Load YAML from a string, bytes or a stream and return it as a dict."""
+    return yaml.load(content, Loader=NoDatesSafeLoader) or {}
 
 
 def write_yaml(path, data):
@@ -18,6 +18,7 @@
 """Represent elaborated information about relations."""
 
 import weakref
+from operator import attrgetter
 from urllib.parse import quote
 
 import attr
@@ -68,21 +69,38 @@ class Association:
         return AssociationSchema().dump(self)
 
 
+def _entity_property(name):
+    """Return a property which reads and assigns an entity attribute."""
+
+    def setter(self, value):
+        setattr(self.entity, name, value)
+
+    return property(attrgetter("entity." + name), setter)
+
+
 class EntityProxyMixin:
     """Implement proxy to entity attribute."""
 
-    def __getattribute__(self, name):
+    __slots__ = ()
+
+    # NOTE: Entity attributes read most often are C-level descriptors so they never reach ``__getattr__``.
+    commit = _entity_property("commit")
+    client = _entity_property("client")
+    path = _entity_property("path")
+    _label = _entity_property("_label")
+    _project = _entity_property("_project")
+
+    def __getattr__(self, name):
         """Proxy entity attributes."""
-        cls = object.__getattribute__(self, "__class__")
-        names = {field.name for field in attr.fields(cls)}
-        names |= set(dir(cls))
-        if name in names:
-            return object.__getattribute__(self, name)
+        # NOTE: Only called when ``name`` is neither a field nor a class attribute. Special attributes such as
+        # ``__dict__`` or copy and pickle hooks belong to the proxy itself and are not forwarded.
+        if name.startswith("__"):
+            raise AttributeError(name)
         entity = object.__getattribute__(self, "entity")
         return getattr(entity, name)
 
 
-@attr.s(cmp=False,)
+@attr.s(cmp=False, slots=True)
 class Usage(EntityProxyMixin):
     """Represent a dependent path."""
 
@@ -113,7 +131,7 @@ class Usage(EntityProxyMixin):
         return UsageSchema().dump(self)
 
 
-@attr.s(cmp=False,)
+@attr.s(cmp=False, slots=True)
 class Generation(EntityProxyMixin):
     """Represent an act of generating a file."""
 
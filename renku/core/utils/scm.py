@@ -16,16 +16,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Helpers utils for interacting with remote source code management tools."""
-import re
+import codecs
+import functools
 
+_WHITESPACE_TABLE = str.maketrans(
+    dict.fromkeys(
+        "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008"
+        "\u2009\u200a\u2028\u2029\u202f\u205f\u3000",
+        "-",
+    )
+)
+"""Map every character matched by the ``\\s`` regex class to ``-``."""
 
-def strip_and_lower(input):
+
+def strip_and_lower(value):
     """Adjust chars to make the input compatible as scm source."""
-    return re.sub(r"\s", r"-", input.strip()).lower()
+    return value.strip().translate(_WHITESPACE_TABLE).lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def git_unicode_unescape(s, encoding="utf-8"):
     """Undoes git/gitpython unicode encoding."""
-    if s.startswith('"'):
-        return s.strip('"').encode("latin1").decode("unicode-escape").encode("latin1").decode(encoding)
-    return s
+    if not s or s[0] != '"':
+        return s
+
+    inner = s[1:-1]
+    if "\\" not in inner:
+        return inner
+
+    # NOTE: ``escape_decode`` reads the string as UTF-8 and resolves git's C-style escapes to the raw path bytes.
+    raw, _ = codecs.escape_decode(inner)
+    return raw.decode(encoding)
@@ -47,6 +47,13 @@ CACHE_UPLOADS_PATH.mkdir(parents=True, exist_ok=True)
 CACHE_PROJECTS_PATH = Path(CACHE_DIR) / Path("projects")
 CACHE_PROJECTS_PATH.mkdir(parents=True, exist_ok=True)
 
+CACHE_REMOTE_PROJECTS_PATH = Path(CACHE_DIR) / Path("remote")
+CACHE_REMOTE_PROJECTS_PATH.mkdir(parents=True, exist_ok=True)
+
+# measured in seconds
+REMOTE_PROJECT_FETCH_INTERVAL = int(os.getenv("REMOTE_PROJECT_FETCH_INTERVAL", 300))
+REMOTE_PROJECT_LOCK_TIMEOUT = int(os.getenv("REMOTE_PROJECT_LOCK_TIMEOUT", 60))
+
 TAR_ARCHIVE_CONTENT_TYPE = "application/x-tar"
 ZIP_ARCHIVE_CONTENT_TYPE = "application/zip"
 
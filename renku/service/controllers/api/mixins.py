@@ -32,6 +32,9 @@ from renku.service.controllers.utils.remote_project import RemoteProject
 class ReadOperationMixin(metaclass=ABCMeta):
     """Read operation mixin."""
 
+    READ_ONLY = True
+    """Operation does not commit, so remote projects can be read from a clone shared with other requests."""
+
     def __init__(self, cache, user_data, request_data):
         """Read operation mixin for controllers."""
         self.user = cache.ensure_user(user_data)
@@ -43,11 +46,16 @@ class ReadOperationMixin(metaclass=ABCMeta):
         # NOTE: This is absolute project path and its set before invocation of `renku_op`,
         # so its safe to use it in controller operations. Its type will always be `pathlib.Path`.
         self.project_path = None
+        self._project = None
 
     @property
     @abstractmethod
     def context(self):
-        """Operation context."""
+        """Operation context.
+
+        Implementations must return the request data deserialized once, e.g. in ``__init__``, since
+        ``context`` is read several times per operation.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -57,22 +65,27 @@ class ReadOperationMixin(metaclass=ABCMeta):
 
     def execute_op(self):
         """Execute renku operation which controller implements."""
-        if "project_id" in self.context:
+        context = self.context
+        if "project_id" in context:
             return self.local()
-        elif "git_url" in self.context:
+        elif "git_url" in context:
             return self.remote()
         else:
             raise RenkuException("context does not contain `project_id` or `git_url`")
 
     def local(self):
         """Execute operation against service cache."""
-        project = self.cache.get_project(self.user, self.context["project_id"])
+        if self._project is None:
+            self._project = self.cache.get_project(self.user, self.context["project_id"])
+        project = self._project
 
         if not project.initialized:
             raise UninitializedProject(project.abs_path)
 
         self.project_path = project.abs_path
 
+        # NOTE: Core commands locate the repository and resolve dataset paths relative to the working directory,
+        # so the operation cannot run without it. Controllers should build their own paths from `project_path`.
         with chdir(self.project_path):
             return self.renku_op()
 
@@ -80,7 +93,14 @@ class ReadOperationMixin(metaclass=ABCMeta):
         """Execute operation against remote project."""
         project = RemoteProject(self.user_data, self.request_data)
 
-        with project.remote() as path:
+        # NOTE: Like `local`, this changes the process-wide working directory, so it must not be moved to a thread
+        # pool. Long running operations belong in the RQ jobs queue instead.
+        if self.READ_ONLY:
+            remote = project.shared_remote(fresh=self.context.get("fresh", False))
+        else:
+            remote = project.remote()
+
+        with remote as path:
             self.project_path = Path(path)
 
             if not (self.project_path / RENKU_HOME / RepositoryApiMixin.METADATA).exists():
@@ -92,6 +112,8 @@ class ReadOperationMixin(metaclass=ABCMeta):
 class ReadWithSyncOperation(ReadOperationMixin, metaclass=ABCMeta):
     """Sync operation mixin."""
 
+    READ_ONLY = False
+
     def sync(self, remote="origin"):
         """Sync with remote."""
         from renku.core.commands.save import repo_sync
@@ -100,6 +122,8 @@ class ReadWithSyncOperation(ReadOperationMixin, metaclass=ABCMeta):
             raise RenkuException("unable to sync with remote since no operation has been executed")
 
         _, remote_branch = repo_sync(Repo(self.project_path), remote=remote)
+        # NOTE: Look up the cached project again for operations executed after a write.
+        self._project = None
         return remote_branch
 
     def execute_and_sync(self, remote="origin"):
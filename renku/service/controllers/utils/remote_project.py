@@ -17,16 +17,33 @@
 # limitations under the License.
 """Utilities for renku service controllers."""
 
+import hashlib
+import os
+import shutil
 import tempfile
+import time
 from contextlib import contextmanager
+from pathlib import Path
 from urllib.parse import urlparse
 
-from git import Repo
+import filelock
+from git import GitError, Repo
 from marshmallow import EXCLUDE
 
+from renku.core.errors import OperationError
 from renku.core.utils.contexts import chdir
+from renku.service.config import CACHE_REMOTE_PROJECTS_PATH, REMOTE_PROJECT_FETCH_INTERVAL, REMOTE_PROJECT_LOCK_TIMEOUT
 from renku.service.serializers.cache import ProjectCloneContext
 
+FETCHED_COMMIT = "renku-fetched-commit"
+"""File in the clone's Git directory which stores the last fetched commit."""
+
+FETCHED_BY = "renku-fetched-by-{0}"
+"""File in the clone's Git directory which is touched whenever given credentials fetch from the remote."""
+
+CLONE_TEMP_PREFIX = "tmp"
+"""Prefix of directories in which shared clones are created before they are moved into place."""
+
 
 class RemoteProject:
     """Parent controller for all controllers with remote support."""
@@ -51,9 +68,164 @@ class RemoteProject:
 
         return url
 
+    @property
+    def public_url(self):
+        """Remote path without credentials."""
+        url = self.remote_url
+        return url._replace(netloc=url.netloc.rpartition("@")[2])
+
+    @property
+    def clone_path(self):
+        """Path of the shared clone for this remote and reference."""
+        key = hashlib.sha256("{0}#{1}".format(self.public_url.geturl(), self.branch).encode("utf-8")).hexdigest()
+        return CACHE_REMOTE_PROJECTS_PATH / key
+
     @contextmanager
     def remote(self):
-        """Retrieve project metadata."""
+        """Retrieve project metadata into a private clone which can be committed to and pushed from."""
         with tempfile.TemporaryDirectory() as td, chdir(td):
             Repo.clone_from(self.remote_url.geturl(), td, branch=self.branch, depth=1)
             yield td
+
+    @contextmanager
+    def shared_remote(self, fresh=False):
+        """Retrieve project metadata into a clone shared by all read-only operations on the remote.
+
+        Operations must not commit to the shared clone since it has no credentials to push with.
+
+        :param fresh: Fetch from the remote even if these credentials fetched recently.
+        """
+        path = self.clone_path
+
+        # NOTE: Requests for the same remote wait for each other instead of sharing a working tree.
+        with _lock(path):
+            if path.exists() and not _is_valid_clone(path):
+                shutil.rmtree(path)
+
+            if not path.exists():
+                self._clone(path)
+
+            self._refresh(path, fresh)
+
+            # NOTE: The modification time tells the cleanup job when the clone was last used.
+            os.utime(path)
+
+            with chdir(path):
+                yield str(path)
+
+    def _fetched_by(self, repo):
+        """File which records when the caller's credentials last fetched into the clone."""
+        key = hashlib.sha256(self.remote_url.geturl().encode("utf-8")).hexdigest()
+        return Path(repo.git_dir) / FETCHED_BY.format(key)
+
+    def _clone(self, path):
+        """Clone the remote and move the clone to ``path`` once it is complete."""
+        clone_path = tempfile.mkdtemp(prefix=CLONE_TEMP_PREFIX, dir=CACHE_REMOTE_PROJECTS_PATH)
+        try:
+            # NOTE: File contents are fetched lazily on checkout; servers without partial clone support
+            # ignore the filter and send all blobs of the single commit.
+            repo = Repo.clone_from(
+                self.remote_url.geturl(),
+                clone_path,
+                branch=self.branch,
+                depth=1,
+                single_branch=True,
+                filter="blob:none",
+            )
+            # NOTE: The clone is shared by all users of the remote, so credentials are only passed per fetch.
+            repo.git.remote("set-url", "origin", self.public_url.geturl())
+            (Path(repo.git_dir) / FETCHED_COMMIT).write_text(repo.head.commit.hexsha)
+            self._fetched_by(repo).touch()
+        except Exception:
+            shutil.rmtree(clone_path, ignore_errors=True)
+            raise
+        Path(clone_path).rename(path)
+
+    def _refresh(self, path, fresh=False):
+        """Reset the clone to the recently fetched commit, fetching first if needed."""
+        repo = Repo(str(path))
+        fetched_commit = Path(repo.git_dir) / FETCHED_COMMIT
+        fetched_by = self._fetched_by(repo)
+
+        # NOTE: Fetching with the caller's credentials also checks that the caller may read the remote. A failed
+        # fetch is raised without touching the clone, which other callers may still read.
+        if fresh or _expired(fetched_by, REMOTE_PROJECT_FETCH_INTERVAL):
+            repo.git.fetch(self.remote_url.geturl(), self.branch, depth=1)
+            fetched_commit.write_text(repo.git.rev_parse("FETCH_HEAD"))
+            fetched_by.touch()
+
+        # NOTE: Discard anything a previous operation left behind.
+        repo.git.reset("--hard", fetched_commit.read_text())
+        repo.git.clean("-fdx")
+
+
+def purge_remote_projects(ttl):
+    """Remove shared clones, unfinished clones and lock files which were not used for ``ttl`` seconds."""
+    for path in list(CACHE_REMOTE_PROJECTS_PATH.iterdir()):
+        if path.name.startswith(CLONE_TEMP_PREFIX):
+            if _expired(path, ttl):
+                shutil.rmtree(path, ignore_errors=True)
+            continue
+
+        if path.suffix != ".lock":
+            continue
+
+        lock_path, path = path, path.with_suffix("")
+        # NOTE: Acquiring the lock truncates the lock file, which updates its modification time.
+        if not _expired(lock_path, ttl):
+            continue
+
+        try:
+            with filelock.FileLock(str(lock_path), timeout=0):
+                if _expired(path, ttl):
+                    shutil.rmtree(path, ignore_errors=True)
+                    # NOTE: Waiters on the removed lock file notice it is gone and lock the new file instead.
+                    lock_path.unlink()
+        except filelock.Timeout:
+            continue
+
+
+@contextmanager
+def _lock(path):
+    """Lock a shared clone for the duration of an operation."""
+    lock_path = "{0}.lock".format(path)
+
+    while True:
+        lock = filelock.FileLock(lock_path, timeout=REMOTE_PROJECT_LOCK_TIMEOUT)
+        try:
+            lock.acquire()
+        except filelock.Timeout as e:
+            raise OperationError("Timed out waiting for another operation on the remote project.") from e
+
+        try:
+            stat = os.stat(lock_path)
+        except FileNotFoundError:
+            stat = None
+
+        # NOTE: The cleanup job may have removed the lock file while we waited on it.
+        if stat and stat.st_ino == os.fstat(lock._lock_file_fd).st_ino:
+            break
+
+        lock.release()
+
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def _is_valid_clone(path):
+    """Check if a shared clone can be used."""
+    try:
+        repo = Repo(str(path))
+        return (Path(repo.git_dir) / FETCHED_COMMIT).exists() and repo.head.is_valid()
+    except GitError:
+        return False
+
+
+def _expired(path, ttl):
+    """Check if path is missing or was last modified more than ``ttl`` seconds ago."""
+    try:
+        return time.time() - path.stat().st_mtime > ttl
+    except FileNotFoundError:
+        return True
@@ -16,8 +16,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Cleanup jobs."""
+import os
+
 from renku.service.cache import ServiceCache
 from renku.service.cache.models.job import USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS
+from renku.service.controllers.utils.remote_project import purge_remote_projects
 from renku.service.logger import worker_log
 
 
@@ -57,3 +60,10 @@ def cache_project_cleanup():
             if project.ttl_expired():
                 worker_log.debug(f"purging project {project.project_id}:{project.name}")
                 project.purge()
+
+
+def cache_remote_projects_cleanup():
+    """Cache remote projects a cleanup job."""
+    worker_log.debug("executing cache remote projects cleanup")
+
+    purge_remote_projects(int(os.getenv("RENKU_SVC_CLEANUP_TTL_PROJECTS", 1800)))
@@ -23,7 +23,7 @@ from datetime import datetime
 from rq_scheduler import Scheduler
 from rq_scheduler.utils import setup_loghandlers
 
-from renku.service.jobs.cleanup import cache_files_cleanup, cache_project_cleanup
+from renku.service.jobs.cleanup import cache_files_cleanup, cache_project_cleanup, cache_remote_projects_cleanup
 from renku.service.jobs.queues import CLEANUP_QUEUE_FILES, CLEANUP_QUEUE_PROJECTS, WorkerQueues
 from renku.service.logger import DEPLOYMENT_LOG_LEVEL, scheduler_log
 
@@ -68,6 +68,14 @@ def schedule():
         result_ttl=cleanup_interval + 1,
     )
 
+    build_scheduler.schedule(
+        scheduled_time=datetime.utcnow(),
+        queue_name=CLEANUP_QUEUE_PROJECTS,
+        func=cache_remote_projects_cleanup,
+        interval=cleanup_interval,
+        result_ttl=cleanup_interval + 1,
+    )
+
     scheduler_log.info(f"log level set to {DEPLOYMENT_LOG_LEVEL}")
     yield build_scheduler
 
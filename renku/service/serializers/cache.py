@@ -240,6 +240,7 @@ class ProjectMigrationCheckRequest(Schema):
 
     git_url = fields.String()
     branch = fields.String()
+    fresh = fields.Boolean(missing=False)
 
 
 class ProjectMigrationCheckResponse(Schema):
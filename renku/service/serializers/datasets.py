@@ -166,6 +166,7 @@ class DatasetListRequest(Schema):
 
     git_url = fields.String()
     branch = fields.String()
+    fresh = fields.Boolean(missing=False)
 
 
 class DatasetListResponse(Schema):
@@ -189,6 +190,7 @@ class DatasetFilesListRequest(Schema):
 
     git_url = fields.String()
     branch = fields.String()
+    fresh = fields.Boolean(missing=False)
 
 
 class DatasetFileDetails(Schema):
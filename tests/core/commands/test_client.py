@@ -58,6 +58,7 @@ def test_safe_class_attributes(tmpdir):
     safe_attributes = [
         "ACTIVITY_INDEX",
         "CACHE",
+        "CONCURRENT_READS_THRESHOLD",
         "CONFIG_NAME",
         "DATASETS",
         "DATA_DIR_CONFIG_KEY",
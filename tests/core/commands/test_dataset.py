@@ -21,19 +21,30 @@ import datetime
 import os
 import shutil
 import stat
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
+import click
 import pytest
 from git import Repo
 
 from renku.core import errors
-from renku.core.commands.dataset import add_file, create_dataset, file_unlink, list_datasets, list_files
+from renku.core.commands.dataset import (
+    _compile_patterns,
+    _match_any,
+    add_file,
+    create_dataset,
+    dataset_remove,
+    file_unlink,
+    list_datasets,
+    list_files,
+)
+from renku.core.commands.format.datasets import DATASETS_FORMATS
 from renku.core.errors import OperationError, ParameterError
 from renku.core.management.repository import DEFAULT_DATA_DIR as DATA_DIR
 from renku.core.models.datasets import Dataset
 from renku.core.models.provenance.agents import Person
 from renku.core.utils.contexts import chdir
-from tests.utils import assert_dataset_is_mutated, raises
+from tests.utils import assert_dataset_is_mutated, make_dataset_with_file, raises
 
 
 @pytest.mark.parametrize(
@@ -175,6 +186,106 @@ def test_list_datasets_default(project):
     assert "ds1" in [dataset.title for dataset in datasets]
 
 
+def test_list_datasets_tabular_skips_files(client, monkeypatch):
+    """Test tabular dataset listing does not load dataset files."""
+    make_dataset_with_file(client, "my-data")
+
+    assert "my-data" in list_datasets(format="tabular")
+
+    listed = []
+    monkeypatch.setitem(DATASETS_FORMATS, "tabular", lambda client, datasets, columns=None: listed.extend(datasets))
+    list_datasets(format="tabular")
+
+    assert ["my-data"] == [dataset.name for dataset in listed]
+    assert [] == listed[0].files
+    assert ["file.txt"] == [f.name for f in list_datasets()[0].files]
+
+
+def test_dataset_files_metadata_is_updated_on_first_access(client, tmp_path):
+    """Test files metadata is resolved against the client's working tree when files are first read."""
+    make_dataset_with_file(client, "my-data")
+    dataset = client.load_dataset("my-data")
+
+    with (client.path / ".gitattributes").open("a") as f:
+        f.write("\n*.txt filter=lfs diff=lfs merge=lfs -text\n")
+
+    with chdir(tmp_path):
+        assert [True] == [file_.is_lfs for file_ in dataset.files]
+
+    assert not client.load_dataset("my-data")._files_metadata_updated
+
+
+def test_datasets_listing_follows_changes(client):
+    """Test listing the same client's datasets after adding, checking out and removing datasets."""
+    commit = client.repo.head.commit
+
+    def names():
+        return {dataset.name for dataset in client.datasets.values()}
+
+    client.create_dataset("ds1")
+    assert {"ds1"} == names()
+    client.create_dataset("ds2")
+    assert {"ds1", "ds2"} == names()
+
+    client.repo.git.add(all=True)
+    client.repo.index.commit("add datasets")
+
+    with client.with_commit(commit):
+        assert set() == names()
+    assert {"ds1", "ds2"} == names()
+
+    with click.Context(click.Command("dataset"), obj=client):
+        dataset_remove("ds1")
+    assert {"ds2"} == names()
+
+
+@pytest.mark.parametrize("threshold", [1, 16])
+def test_get_datasets_reads_serially_or_concurrently(client, monkeypatch, threshold):
+    """Test datasets are the same whether their metadata files are read serially or concurrently."""
+    client.create_dataset("ds1")
+    client.create_dataset("ds2")
+    monkeypatch.setattr(client, "CONCURRENT_READS_THRESHOLD", threshold)
+
+    datasets = client.get_datasets()
+
+    assert sorted(client.get_datasets_metadata_files()) == sorted(datasets)
+    assert {"ds1", "ds2"} == {dataset.name for dataset in datasets.values()}
+
+
+def test_datasets_listing_after_failed_creation(client):
+    """Test a dataset which is cleaned up after a failed creation is not listed."""
+    client.create_dataset("ds1")
+    assert ["ds1"] == [dataset.name for dataset in client.datasets.values()]
+
+    with pytest.raises(ValueError):
+        with client.with_dataset("ds2", create=True):
+            assert 2 == len(client.datasets)
+            raise ValueError
+
+    assert ["ds1"] == [dataset.name for dataset in client.datasets.values()]
+
+
+@pytest.mark.parametrize(
+    "pattern", ["*.csv", "/data/*", "data/*", "a/*/c", "a/b/c/d/e", "**", "**/*.csv", "a/**", "/a/b/c", "*", "[ab]/?"],
+)
+@pytest.mark.parametrize(
+    "path", ["file.csv", "data/file.csv", "/data/file.csv", "a/b/c", "/a/b/c", "x/a/b/c", "a/b", "a/c", "b/c/d.csv"]
+)
+def test_compiled_patterns_match_like_path_match(pattern, path):
+    """Test compiled file patterns match the same paths as ``PurePath.match``."""
+    parts = PurePosixPath(path).parts[::-1]
+
+    assert PurePosixPath(path).match(pattern) == _match_any(parts, _compile_patterns([pattern]))
+
+
+def test_compile_empty_pattern():
+    """Test compiling an empty pattern fails like ``PurePath.match``."""
+    with pytest.raises(ValueError):
+        PurePosixPath("file").match("")
+    with pytest.raises(ValueError):
+        _compile_patterns([""])
+
+
 def test_list_files_default(project, tmpdir):
     """Test a default file listing."""
     create_dataset("ds1", title="", description="", creators=[], commit_message="my awesome dataset")
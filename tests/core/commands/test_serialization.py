@@ -20,9 +20,14 @@
 import datetime
 from urllib.parse import urljoin
 
+import pytest
+
+from renku.core import errors
 from renku.core.management.client import LocalClient
-from renku.core.models.datasets import Dataset
+from renku.core.models.calamus import prov, schema
+from renku.core.models.datasets import Dataset, _remove_dataset_files
 from renku.core.utils.uuid import is_uuid
+from tests.utils import make_dataset_with_file
 
 
 def test_dataset_deserialization(client, dataset):
@@ -101,3 +106,67 @@ def test_dataset_with_multiple_project_version(client_with_datasets):
     dataset = client_with_datasets.load_dataset("dataset-2")
 
     assert {max_version} == {f._project.version for f in dataset.files}
+
+
+def test_dataset_deserialization_without_files(client):
+    """Test Dataset deserialization that skips dataset files."""
+    make_dataset_with_file(client, "my-data")
+    path = client.get_dataset_path("my-data")
+
+    dataset = Dataset.from_yaml(path, client=client)
+    dataset_without_files = Dataset.from_yaml(path, client=client, skip_files=True)
+
+    assert ["file.txt"] == [f.name for f in dataset.files]
+    assert [] == dataset_without_files.files
+    assert dataset.name == dataset_without_files.name
+    assert dataset.identifier == dataset_without_files.identifier
+
+
+def test_dataset_without_files_is_read_only(client):
+    """Test a Dataset deserialized without its files cannot be written or mutated."""
+    make_dataset_with_file(client, "my-data")
+    path = client.get_dataset_path("my-data")
+    content = path.read_text()
+
+    dataset = Dataset.from_yaml(path, client=client, skip_files=True)
+
+    with pytest.raises(errors.OperationError, match="without its files"):
+        dataset.to_yaml()
+    with pytest.raises(errors.OperationError, match="without its files"):
+        dataset.mutate()
+
+    assert content == path.read_text()
+    Dataset.from_yaml(path, client=client).to_yaml()
+
+
+def test_remove_dataset_files():
+    """Test removing dataset files from flattened JSON-LD data."""
+    dataset_node = {
+        "@id": "https://localhost/datasets/1",
+        "@type": [str(prov.Entity), str(schema.Dataset)],
+        str(schema.hasPart): [{"@id": "file://file-1"}, {"@id": "file://file-2"}],
+        str(schema.creator): [{"@id": "mailto:me@example.com"}],
+    }
+    data = [
+        dataset_node,
+        {"@id": "file://file-1", "@type": [str(schema.DigitalDocument)]},
+        {"@id": "file://file-2", "@type": [str(schema.DigitalDocument)]},
+        {"@id": "mailto:me@example.com", "@type": [str(schema.Person)]},
+    ]
+
+    result = _remove_dataset_files(data)
+
+    assert ["https://localhost/datasets/1", "mailto:me@example.com"] == [node["@id"] for node in result]
+    assert str(schema.hasPart) not in dataset_node
+    assert [{"@id": "mailto:me@example.com"}] == dataset_node[str(schema.creator)]
+
+
+def test_remove_dataset_files_single_part():
+    """Test removing a single dataset file that is not wrapped in a list."""
+    data = [
+        {"@id": "dataset", "@type": str(schema.Dataset), str(schema.hasPart): {"@id": "file"}},
+        {"@id": "file", "@type": str(schema.DigitalDocument)},
+    ]
+
+    assert [{"@id": "dataset", "@type": str(schema.Dataset)}] == _remove_dataset_files(data)
+    assert {"@id": "dataset"} == _remove_dataset_files({"@id": "dataset"})
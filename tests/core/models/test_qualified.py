@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test qualified relations."""
+import pytest
+
+from renku.core.models.entities import Entity
+from renku.core.models.provenance.qualified import Generation, Usage
+
+
+@pytest.fixture(params=[lambda entity: Usage(entity=entity, role="input"), lambda entity: Generation(entity, id="id")])
+def proxy(request):
+    """Return a usage or a generation of an entity."""
+    return request.param(Entity(path="data/file.txt"))
+
+
+def test_entity_attributes_are_forwarded(proxy):
+    """Test reading entity attributes through a usage or generation."""
+    assert "data/file.txt" == proxy.path
+    assert proxy.entity._label == proxy._label
+    assert proxy.commit is None
+    assert proxy.parent is None
+
+
+def test_special_attributes_are_not_forwarded(proxy):
+    """Test special attributes are looked up on the proxy only."""
+    assert hasattr(proxy.entity, "__dict__")
+
+    with pytest.raises(AttributeError):
+        proxy.__dict__
+
+
+def test_entity_attributes_are_assigned(proxy):
+    """Test assigning entity attributes through a usage or generation."""
+    proxy.path = "data/other.txt"
+    proxy.commit = "commit"
+
+    assert "data/other.txt" == proxy.entity.path
+    assert "commit" == proxy.entity.commit
+    assert "data/other.txt" == proxy.path
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Source code management utils tests."""
+
+import pytest
+
+from renku.core.utils.scm import git_unicode_unescape, strip_and_lower
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("data/file.csv", "data/file.csv"),
+        ("", ""),
+        ('"data/file name.csv"', "data/file name.csv"),
+        ('"data/\\303\\244.csv"', "data/ä.csv"),
+        ('"\\346\\227\\245\\346\\234\\254/\\360\\237\\230\\200"', "日本/😀"),
+        ('"data/\\"quoted\\".csv"', 'data/"quoted".csv'),
+        ('"end\\""', 'end"'),
+        ('"back\\\\slash"', "back\\slash"),
+        ('"tab\\there"', "tab\there"),
+        ('"\\303\\244 \\"\\\\"', 'ä "\\'),
+        ('"ä \\"x\\""', 'ä "x"'),
+    ],
+)
+def test_git_unicode_unescape(path, expected):
+    """Test unescaping of paths quoted by git."""
+    assert expected == git_unicode_unescape(path)
+
+
+@pytest.mark.parametrize(
+    "value,expected", [("My Project", "my-project"), ("  Tab\tName ", "tab-name"), ("No\u00a0Break", "no-break")],
+)
+def test_strip_and_lower(value, expected):
+    """Test normalization of names for source code management."""
+    assert expected == strip_and_lower(value)
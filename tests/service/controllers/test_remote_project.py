@@ -16,12 +16,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service project remote abstraction tests."""
+import os
+import time
+from pathlib import Path
+
+import filelock
 import pytest
+from git import GitCommandError, Repo
 from marshmallow import ValidationError
 
 import renku
 from renku.core.commands.migrate import migrations_check, migrations_versions
-from renku.service.controllers.utils.remote_project import RemoteProject
+from renku.core.errors import OperationError
+from renku.service.controllers.utils import remote_project
+from renku.service.controllers.utils.remote_project import RemoteProject, purge_remote_projects
+
+USER_DATA = {
+    "fullname": "testing user",
+    "email": "testing@user.com",
+    "token": "123",
+}
+
+
+@pytest.fixture
+def local_remote(tmp_path, monkeypatch):
+    """Remote project served from a local repository and a controller for it."""
+    monkeypatch.setattr(remote_project, "CACHE_REMOTE_PROJECTS_PATH", tmp_path / "cache")
+    (tmp_path / "cache").mkdir()
+
+    repo = Repo.init(str(tmp_path / "remote"))
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "testing user")
+        config.set_value("user", "email", "testing@user.com")
+    (tmp_path / "remote" / "README.md").write_text("first")
+    repo.index.add(["README.md"])
+    repo.index.commit("first")
+
+    ctrl = RemoteProject(USER_DATA, {"git_url": "https://dev.renku.ch/gitlab/contact/import-me"})
+    ctrl.git_url = "file://{0}".format(repo.working_dir)
+
+    yield repo, ctrl
 
 
 def test_project_metadata_remote():
@@ -110,3 +144,114 @@ def test_remote_project_context():
         assert automated_update_possible is False
         assert docker_update_possible is False
         assert project_supported is True
+
+
+def test_remote_project_clone_path_without_credentials():
+    """Check clones are shared between credentials and do not depend on them."""
+    request_data = {"git_url": "https://dev.renku.ch/gitlab/contact/import-me"}
+    ctrl = RemoteProject(USER_DATA, request_data)
+    other_ctrl = RemoteProject({**USER_DATA, "token": "456"}, request_data)
+
+    assert "dev.renku.ch" == ctrl.public_url.netloc
+    assert ctrl.clone_path == other_ctrl.clone_path
+    assert "123" not in str(ctrl.clone_path)
+
+
+def test_remote_project_clone_reused(local_remote):
+    """Check the clone of a remote project is reused and reset between uses."""
+    repo, ctrl = local_remote
+
+    with ctrl.shared_remote() as project_path:
+        assert "first" == (ctrl.clone_path / "README.md").read_text()
+        (ctrl.clone_path / "README.md").write_text("modified")
+        (ctrl.clone_path / "untracked").write_text("untracked")
+
+    with ctrl.shared_remote() as other_project_path:
+        assert project_path == other_project_path
+        assert "first" == (ctrl.clone_path / "README.md").read_text()
+        assert not (ctrl.clone_path / "untracked").exists()
+        assert ctrl.public_url.geturl() == Repo(other_project_path).remotes.origin.url
+
+
+def test_remote_project_fresh(local_remote):
+    """Check recently fetched clones are only updated on request."""
+    repo, ctrl = local_remote
+
+    with ctrl.shared_remote():
+        pass
+
+    (Path(repo.working_dir) / "README.md").write_text("second")
+    repo.index.add(["README.md"])
+    second = repo.index.commit("second")
+
+    with ctrl.shared_remote():
+        assert "first" == (ctrl.clone_path / "README.md").read_text()
+
+    with ctrl.shared_remote(fresh=True) as project_path:
+        assert second.hexsha == Repo(project_path).head.commit.hexsha
+        assert "second" == (ctrl.clone_path / "README.md").read_text()
+
+
+def test_purge_remote_projects(local_remote):
+    """Check clones of remote projects are purged once unused for too long."""
+    repo, ctrl = local_remote
+
+    with ctrl.shared_remote():
+        pass
+
+    purge_remote_projects(60)
+    assert ctrl.clone_path.exists()
+
+    lock_path = Path("{0}.lock".format(ctrl.clone_path))
+    unfinished_clone = ctrl.clone_path.with_name("tmp-unfinished")
+    unfinished_clone.mkdir()
+
+    expired = time.time() - 120
+    for path in (ctrl.clone_path, lock_path, unfinished_clone):
+        os.utime(path, (expired, expired))
+    purge_remote_projects(60)
+    assert not ctrl.clone_path.exists()
+    assert not lock_path.exists()
+    assert not unfinished_clone.exists()
+
+    with ctrl.shared_remote():
+        assert "first" == (ctrl.clone_path / "README.md").read_text()
+
+
+def test_remote_project_private_clone(local_remote):
+    """Check operations which commit get a private clone with credentials."""
+    repo, ctrl = local_remote
+
+    with ctrl.remote() as project_path:
+        assert ctrl.clone_path != Path(project_path)
+        assert ctrl.git_url == Repo(project_path).remotes.origin.url
+
+    assert not Path(project_path).exists()
+    assert not ctrl.clone_path.exists()
+
+
+def test_remote_project_failed_fetch_keeps_clone(local_remote):
+    """Check a caller failing to fetch does not remove the clone other callers use."""
+    repo, ctrl = local_remote
+
+    with ctrl.shared_remote():
+        pass
+
+    Path(repo.working_dir).rename(Path(repo.working_dir).with_name("moved"))
+
+    with pytest.raises(GitCommandError):
+        with ctrl.shared_remote(fresh=True):
+            pass
+
+    assert "first" == (ctrl.clone_path / "README.md").read_text()
+
+
+def test_remote_project_lock_timeout(local_remote, monkeypatch):
+    """Check waiting for a busy clone times out."""
+    repo, ctrl = local_remote
+    monkeypatch.setattr(remote_project, "REMOTE_PROJECT_LOCK_TIMEOUT", 0)
+
+    with filelock.FileLock("{0}.lock".format(ctrl.clone_path)):
+        with pytest.raises(OperationError):
+            with ctrl.shared_remote():
+                pass
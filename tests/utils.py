@@ -18,6 +18,7 @@
 """Test utility functions."""
 import uuid
 from contextlib import contextmanager
+from pathlib import Path
 
 import pytest
 
@@ -74,3 +75,21 @@ def assert_dataset_is_mutated(old, new, mutator=None):
         old_creators = {c.email for c in old.creators}
         new_creators = {c.email for c in new.creators}
         assert new_creators == old_creators | {mutator.email}
+
+
+def make_dataset_with_file(client, name, filename="file.txt"):
+    """Create a dataset with one committed file without using external storage."""
+    from renku.core.management.repository import DEFAULT_DATA_DIR
+    from renku.core.models.datasets import DatasetFile
+
+    path = Path(DEFAULT_DATA_DIR) / name / filename
+
+    with client.with_dataset(name, create=True) as dataset:
+        (client.path / path).parent.mkdir(parents=True, exist_ok=True)
+        (client.path / path).write_text(name)
+        client.repo.git.add(str(path))
+        client.repo.index.commit(f"add {path}")
+
+        dataset.update_files([DatasetFile.from_revision(client, path=str(path))])
+
+    return dataset